@@ -0,0 +1,69 @@
+# Shared calculations used by both the cash on hand and the profit and loss modules.
+# Both reports are analyzed in exactly the same way, so the work lives here once instead of being copied.
+from array import array
+# heapq provides partial selection, which picks the few smallest items without sorting the whole list.
+import heapq
+# compress() filters a sequence with a mask of true/false values in C.
+from itertools import compress, repeat
+# sub and lt are the C implementations of the '-' and '<' operators, which let map() work on whole sequences.
+# itemgetter picks the amount out of a (day, amount) pair, again without calling a Python function.
+from operator import itemgetter, lt, sub
+
+# Ranks (day, amount) deficits by their amount.
+deficit_amount = itemgetter(1)
+# How many of the largest deficits daily_extremes selects.
+TOP_DEFICITS = 3
+
+def daily_differences(days, values):
+    """
+    Calculates the day-to-day differences of a series of values.
+
+    Parameters:
+    days (array.array): The day for each value.
+    values (array.array): The value recorded on each day.
+
+    Returns:
+    Tuple[array.array, array.array]: Two parallel arrays holding the days (from the second day onwards) and
+                                     the difference from the previous day's value.
+    """
+    # Subtract each day's value from the next day's in one pass, pairing the array with itself shifted by one.
+    differences = array('d', map(sub, values[1:], values))
+
+    return days[1:], differences
+
+def daily_extremes(days, differences):
+    """
+    Finds the highest increase, the highest decrease, every deficit and the TOP_DEFICITS largest deficits
+    in a series of daily differences. The deficits are returned as well so callers can report them without scanning again.
+
+    Parameters:
+    days (array.array): The day for each entry in differences.
+    differences (array.array): The daily differences, as returned by daily_differences.
+
+    Returns:
+    Tuple[Tuple[int, float], Tuple[int, float], List[Tuple[int, float]], List[Tuple[int, float]]]:
+        The highest increase, the highest decrease, every (day, deficit) in day order,
+        and the TOP_DEFICITS largest deficits, largest first.
+    """
+    highest_increase = (0, 0)  # Placeholder kept when no day has an increase.
+    highest_decrease = (0, 0)  # Placeholder kept when no day has a decrease.
+
+    # max() scans the whole array in C. index() then finds the first day with that change,
+    # so the earliest day is kept when several days share the same amount, just like a left-to-right loop would.
+    largest_change = max(differences, default=0)
+    if largest_change > 0:
+        highest_increase = (days[differences.index(largest_change)], largest_change)
+
+    # Collect the days with a deficit (negative change). compress() keeps the (day, change) pairs whose
+    # mask entry is true, so there is no Python-level if statement to evaluate for every day.
+    deficits = list(compress(zip(days, differences), map(lt, differences, repeat(0))))
+
+    # Get the TOP_DEFICITS largest deficits. heapq.nsmallest only keeps that many candidates while scanning
+    # instead of sorting every deficit.
+    top_deficits = heapq.nsmallest(TOP_DEFICITS, deficits, key=deficit_amount)
+
+    # The largest deficit is also the highest decrease, so it is taken from the top deficits instead of scanning again.
+    if top_deficits:
+        highest_decrease = top_deficits[0]
+
+    return highest_increase, highest_decrease, deficits, top_deficits
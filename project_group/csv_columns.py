@@ -0,0 +1,32 @@
+# Import the csv module to work with csv files
+import csv
+
+def read_columns(file_path, *column_names):
+    """
+    Reads the named columns from a CSV file. This is shared by the cash on hand, overheads and
+    profit and loss readers, so the file handling only lives in one place.
+
+    Parameters:
+    file_path (str): The path to the CSV file to read.
+    *column_names (str): The header names of the columns to return.
+
+    Returns:
+    Tuple[Tuple[str, ...], ...]: One tuple of raw field values per requested column, in the order requested.
+    """
+    # The 'utf-8-sig' encoding strips the BOM (Byte Order Mark) that these reports start with.
+    with open(file_path, 'r', encoding='utf-8-sig') as file:
+        reader = csv.reader(file)
+        # Read the header once to find the position of each column, then parse every remaining row in one go.
+        # filter(None, ...) drops blank lines, which csv.reader returns as empty rows.
+        header = next(reader, None)
+        # An empty file has no header and no rows, so it simply gives empty columns.
+        if header is None:
+            return tuple(() for _ in column_names)
+        column_indexes = [header.index(name) for name in column_names]
+        rows = list(filter(None, reader))
+
+    # Turn the rows into columns with zip(*rows). The number of rows is known by now, so each column is
+    # created once at its final size instead of growing one append at a time.
+    columns = list(zip(*rows)) or [()] * len(header)
+
+    return tuple(columns[index] for index in column_indexes)
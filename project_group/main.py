@@ -5,11 +5,47 @@
 from cash_on_hand import read_cash_on_hand, compute_differences as compute_cash_differences, find_extremes as find_cash_extremes
 from overheads import read_overheads, find_highest_overhead
 from profit_loss import read_profit_loss, compute_differences as compute_profit_differences, find_extremes as find_profit_extremes
+# The number of top deficits the analysis selects, which needs one ordinal label each.
+from analysis import TOP_DEFICITS
+# The three reports are independent of each other, so they can be read and analyzed at the same time.
+from concurrent.futures import ThreadPoolExecutor
 
-# A function to sort a list of tuples based on the second item in each tuple.
-def sort_by_amount(item):
-    # Returns the second element of the tuple for sorting purposes.
-    return item[1]
+# Ordinal labels for the top 3 deficits, built once instead of on every loop iteration.
+ORDINALS = ("1ST", "2ND", "3RD")
+# zip() pairs these labels with the top deficits below, so a mismatch would silently drop lines from the report.
+assert len(ORDINALS) == TOP_DEFICITS, "ORDINALS needs one label for each of the TOP_DEFICITS deficits"
+
+# Templates for the lines that repeat once per deficit. They are defined once here and filled in with
+# str.format, instead of an f-string being assembled again for every line.
+CASH_DEFICIT_LINE = "[CASH DEFICIT] DAY: {}, AMOUNT: USD{}\n"
+TOP_CASH_DEFICIT_LINE = "[{} HIGHEST CASH DEFICIT] DAY: {}, AMOUNT: USD{}\n"
+PROFIT_DEFICIT_LINE = "[NET PROFIT DEFICIT] DAY: {}, AMOUNT: USD{}\n"
+TOP_PROFIT_DEFICIT_LINE = "[{} HIGHEST NET PROFIT DEFICIT] DAY: {}, AMOUNT: USD{}\n"
+
+def analyze_cash_on_hand(file_path):
+    """
+    Reads the cash on hand data and finds its extremes, such as deficits.
+    Returns the highest increase, highest decrease, all deficits and the top 3 deficits.
+    """
+    days, cash_on_hand = read_cash_on_hand(file_path)
+    days, differences = compute_cash_differences(days, cash_on_hand)
+    return find_cash_extremes(days, differences)
+
+def analyze_overheads(file_path):
+    """
+    Reads the overheads data and returns the category with the highest overhead.
+    """
+    categories, overheads = read_overheads(file_path)
+    return find_highest_overhead(categories, overheads)
+
+def analyze_profit_loss(file_path):
+    """
+    Reads the profit and loss data and finds its extremes.
+    Returns the highest increase, highest decrease, all deficits and the top 3 deficits.
+    """
+    days, net_profits = read_profit_loss(file_path)
+    days, differences = compute_profit_differences(days, net_profits)
+    return find_profit_extremes(days, differences)
 
 def generate_summary_report():
     """
@@ -17,77 +53,75 @@ def generate_summary_report():
     to generate a coherent and comprehensive summary of a company's financial activities.
     The output is a text file that provides clear and actionable insights into the company's financial health.
     """
-    # Read and analyze the cash on hand data from the corresponding CSV file.
-    # This involves calculating daily differences and identifying any extremes, such as deficits.
-    cash_data = read_cash_on_hand('csv_reports/cash_on_hand.csv')
-    cash_differences = compute_cash_differences(cash_data)
-    cash_increase, cash_decrease, cash_deficits = find_cash_extremes(cash_differences)
+    # The three CSV files do not depend on each other, so each one is read and analyzed on its own thread.
+    # The csv module holds the GIL while parsing, so on files this small the threads mostly just run in turn;
+    # the report waits for all three results before it is written.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # Read and analyze the cash on hand data from the corresponding CSV file.
+        # This involves calculating daily differences and identifying any extremes, such as deficits.
+        cash_future = executor.submit(analyze_cash_on_hand, 'csv_reports/cash_on_hand.csv')
+        # Read and determine the highest overhead from the overheads CSV file.
+        # This information is crucial for understanding cost structures and identifying potential savings.
+        overhead_future = executor.submit(analyze_overheads, 'csv_reports/Overheads.csv')
+        # Read and analyze profit and loss data from the corresponding CSV file.
+        # This helps in understanding the profitability trends and identifying any problem areas.
+        profit_future = executor.submit(analyze_profit_loss, 'csv_reports/Profit_and_Loss.csv')
+
+    # The extremes also include every deficit, so the report below never has to scan the differences again.
+    cash_increase, cash_decrease, cash_deficits, cash_top_deficits = cash_future.result()
+    highest_overhead = overhead_future.result()
+    profit_increase, profit_decrease, profit_deficits, profit_top_deficits = profit_future.result()
     
-    # Read and determine the highest overhead from the overheads CSV file.
-    # This information is crucial for understanding cost structures and identifying potential savings.
-    overheads_data = read_overheads('csv_reports/Overheads.csv')
-    highest_overhead = find_highest_overhead(overheads_data)
+    # Collect every line of the report in a list first, so the whole report can be written out in one go.
+    report = []
+
+    # Add the highest overhead category and amount to the summary report.
+    # This gives a quick snapshot of the most significant expense the company is incurring.
+    report.append(f"[HIGHEST OVERHEAD] {highest_overhead['category'].upper()}: {highest_overhead['overhead']}%\n\n")
+
+    # Analyze cash on hand trends to determine if there is a consistent surplus or deficit.
+    # The trend is consistent when no day has a deficit, which the list of deficits already tells us.
+    consistent_cash = not cash_deficits
+    # Similarly, analyze profit trends to determine if there is a consistent surplus or deficit.
+    consistent_profit = not profit_deficits
     
-    # Read and analyze profit and loss data from the corresponding CSV file.
-    # This helps in understanding the profitability trends and identifying any problem areas.
-    profit_loss_data = read_profit_loss('csv_reports/Profit_and_Loss.csv')
-    profit_differences = compute_profit_differences(profit_loss_data)
-    profit_increase, profit_decrease, profit_deficits = find_profit_extremes(profit_differences)
+    # If there's a consistent cash surplus, add only the highest surplus to the report.
+    # This simplifies the report for readers, providing a clear indicator of financial health.
+    if consistent_cash:
+        report.append(f"[HIGHEST CASH SURPLUS] DAY: {cash_increase[0]}, AMOUNT: USD{cash_increase[1]}\n\n")
+    else:
+        # If the cash trend is fluctuating, list all days with cash deficits.
+        # This detailed breakdown helps identify specific days which contributed most to the deficit.
+        report.extend([CASH_DEFICIT_LINE.format(day, abs(deficit)) for day, deficit in cash_deficits])
+        report.append("\n")
+        # Additionally, highlight the top 3 days with the highest cash deficits for quick reference.
+        # find_cash_extremes already returns them ordered from the largest deficit down.
+        report.extend([TOP_CASH_DEFICIT_LINE.format(ordinal, day, abs(deficit))
+                       for ordinal, (day, deficit) in zip(ORDINALS, cash_top_deficits)])
+        report.append("\n")
     
+    # Add Profit and Loss results
+    if consistent_profit:
+        # If the profit trend is consistent, we utilize conditional logic to decide what to add to the report.
+        # Here, we use string formatting to construct a message that includes the day and the amount
+        # which represents the highest net profit surplus.
+        report.append(f"[HIGHEST NET PROFIT SURPLUS] DAY: {profit_increase[0]}, AMOUNT: USD{profit_increase[1]}\n\n")
+    else:
+        # For fluctuating profit data, we write out each deficit already found by find_profit_extremes.
+        # The abs() function is applied to format the deficit as a positive number for the report.
+        report.extend([PROFIT_DEFICIT_LINE.format(day, abs(deficit)) for day, deficit in profit_deficits])
+        report.append("\n")
+
+        # find_profit_extremes already returns the days with the largest deficits in order, so no re-sort is needed.
+        # We use zip to pair each deficit with its ordinal ranking (1st, 2nd, 3rd) for the report.
+        report.extend([TOP_PROFIT_DEFICIT_LINE.format(ordinal, day, abs(deficit))
+                       for ordinal, (day, deficit) in zip(ORDINALS, profit_top_deficits)])
+        report.append("\n")
+
     # Open (or create if it doesn't exist) the summary report file in write mode.
-    with open('summary_report.txt', 'w') as file:
-        # Write the highest overhead category and amount to the summary report.
-        # This gives a quick snapshot of the most significant expense the company is incurring.
-        file.write(f"[HIGHEST OVERHEAD] {highest_overhead['category'].upper()}: {highest_overhead['overhead']}%\n\n")
-
-        # Analyze cash on hand trends to determine if there is a consistent surplus or deficit.
-        consistent_cash = all(difference >= 0 for _, difference in cash_differences)
-        # Similarly, analyze profit trends to determine if there is a consistent surplus or deficit.
-        consistent_profit = all(difference >= 0 for _, difference in profit_differences)
-        
-        # If there's a consistent cash surplus, write only the highest surplus to the report.
-        # This simplifies the report for readers, providing a clear indicator of financial health.
-        if consistent_cash:
-            file.write(f"[HIGHEST CASH SURPLUS] DAY: {cash_increase[0]}, AMOUNT: USD{cash_increase[1]}\n\n")
-        else:
-            # If the cash trend is fluctuating, list all days with cash deficits.
-            # This detailed breakdown helps identify specific days which contributed most to the deficit.
-            for day, deficit in cash_differences:
-                if deficit < 0:
-                    file.write(f"[CASH DEFICIT] DAY: {day}, AMOUNT: USD{abs(deficit)}\n")
-            file.write("\n")
-            # Additionally, highlight the top 3 days with the highest cash deficits for quick reference.
-            cash_deficits_sorted = sorted(cash_deficits, key=sort_by_amount)[:3]
-            for i, (day, deficit) in enumerate(cash_deficits_sorted, start=1):
-                ordinal = ["1ST", "2ND", "3RD"][i - 1]
-                file.write(f"[{ordinal} HIGHEST CASH DEFICIT] DAY: {day}, AMOUNT: USD{abs(deficit)}\n")
-            file.write("\n")
-        
-        # Write Profit and Loss results
-        if consistent_profit:
-         # If the profit trend is consistent, we utilize conditional logic to decide what to write to the file.
-         # Here, we use string formatting to construct a message that includes the day and the amount
-         # which represents the highest net profit surplus.
-            file.write(f"[HIGHEST NET PROFIT SURPLUS] DAY: {profit_increase[0]}, AMOUNT: USD{profit_increase[1]}\n\n")
-        else:
-         # For fluctuating profit data, we iterate over each day's profit differences using a for loop.
-         # This loop, combined with a conditional statement, checks for and writes out each deficit.
-            for day, deficit in profit_differences:
-                if deficit < 0:
-                    # The abs() function is applied to format the deficit as a positive number for the report.
-                    file.write(f"[NET PROFIT DEFICIT] DAY: {day}, AMOUNT: USD{abs(deficit)}\n")
-            file.write("\n")
-            
-
-            # We sort the list of deficits to find the days with the largest deficits.
-            profit_deficits_sorted = sorted(profit_deficits, key=sort_by_amount)[:3]
-            for i, (day, deficit) in enumerate(profit_deficits_sorted, start=1):
-                # We use enumerate in the for loop to get both the index and deficit amount.
-                # The index is used to determine the ordinal ranking (1st, 2nd, 3rd) for the report.
-                ordinal = ["1ST", "2ND", "3RD"][i - 1]
-                file.write(f"[{ordinal} HIGHEST NET PROFIT DEFICIT] DAY: {day}, AMOUNT: USD{abs(deficit)}\n")
-            file.write("\n")
-        # Write Profit and Loss results
+    # A 64 KiB buffer holds the whole report, and joining the lines means it is written with a single call.
+    with open('summary_report.txt', 'w', buffering=1 << 16) as file:
+        file.write("".join(report))
 
 # Execute the report generation
 generate_summary_report()
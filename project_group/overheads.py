@@ -1,52 +1,47 @@
-# Import the csv module to work with csv files
-import csv
+# Import the shared CSV helper and typed arrays to read and store the report columns
+from array import array
+from csv_columns import read_columns
 
 def read_overheads(file_path):
     """
-    Reads the overheads from a CSV file and stores the data in a list of dictionaries.
+    Reads the overheads from a CSV file and stores the data in two parallel sequences.
     
     Parameters:
     file_path (str): The path to the CSV file to read.
 
     Returns:
-    list: A list of dictionaries where each dictionary contains the category and the overhead amount.
+    tuple: The category names and an array of the matching overhead amounts.
     """
-    overheads = []
+    # Read the raw columns with the shared CSV helper
+    categories, overheads = read_columns(file_path, 'Category', 'Overheads')
     
-    # Open the CSV file and create a dictionary reader
-    with open(file_path, 'r', encoding='utf-8-sig') as file:  # Use encoding to handle BOM
-        reader = csv.DictReader(file)
-        
-        # Loop over each row in the CSV file
-        for row in reader:
-            # Store the category and overhead in a dictionary
-            category = row['Category']
-            overhead = float(row['Overheads'])
-            overheads.append({'category': category, 'overhead': overhead})
+    # Convert the overhead amounts in bulk into an array that runs parallel to the categories
+    overheads = array('d', map(float, overheads))
     
-    return overheads
+    return categories, overheads
 
-def find_highest_overhead(overheads):
+def find_highest_overhead(categories, overheads):
     """
     Finds the category with the highest overhead.
     
     Parameters:
-    overheads (list): A list of dictionaries containing the category and overhead amount.
+    categories (tuple): The category names.
+    overheads (array.array): The overhead amount for each category.
 
     Returns:
     dict: A dictionary containing the category and the highest overhead amount.
     """
     highest_overhead = {'category': '', 'overhead': 0}
     
-    # Loop over each category's overhead to find the highest
-    for category_data in overheads:
-        if category_data['overhead'] > highest_overhead['overhead']:
-            highest_overhead = category_data
+    # max() finds the highest overhead in C, and index() gives the position of the first category with that amount
+    highest_amount = max(overheads, default=0)
+    if highest_amount > 0:
+        highest_overhead = {'category': categories[overheads.index(highest_amount)], 'overhead': highest_amount}
     
     return highest_overhead
 
 # Example usage:
-# overheads_data = read_overheads('Overheads.csv')
-# highest_overhead = find_highest_overhead(overheads_data)
+# categories, overheads = read_overheads('Overheads.csv')
+# highest_overhead = find_highest_overhead(categories, overheads)
 # print(f"Highest overhead category is {highest_overhead['category']} with an amount of {highest_overhead['overhead']}")
 
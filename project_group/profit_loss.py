@@ -1,90 +1,56 @@
-# Import the csv module to work with csv files
-import csv
+# Import the shared CSV helper and typed arrays to read and store the report columns
+from array import array
+from csv_columns import read_columns
+# Sharing the difference and extremes calculations with the cash on hand module.
+from analysis import daily_differences, daily_extremes
 
 def read_profit_loss(file_path):
     """
-    Reads the net profit from a CSV file and stores the data in a list of tuples.
+    Reads the net profit from a CSV file and stores the data in two parallel arrays.
     
     Parameters:
     file_path (str): The path to the CSV file to read.
 
     Returns:
-    List[Tuple[int, float]]: A list of tuples where each tuple contains the day and the net profit for that day.
+    Tuple[array.array, array.array]: The days as integers ('q') and the net profit for each day as floats ('d').
     """
-    profit_loss_data = []
-    
-    # Open the CSV file and read it using the csv.DictReader
-    with open(file_path, 'r', encoding='utf-8-sig') as file:  # Use encoding to handle BOM
-        reader = csv.DictReader(file)
-        for row in reader:
-            day = int(row['Day'])
-            net_profit = float(row['Net Profit'])
-            profit_loss_data.append((day, net_profit))
+    # Reading the raw columns with the shared CSV helper.
+    days, net_profits = read_columns(file_path, 'Day', 'Net Profit')
+
+    # Keeping the columns as typed arrays, converting them in bulk with map() instead of a Python loop.
+    days = array('q', map(int, days))
+    net_profits = array('d', map(float, net_profits))
     
-    return profit_loss_data
+    return days, net_profits
 
-def compute_differences(profit_loss_data):
+def compute_differences(days, net_profits):
     """
     Computes the daily differences in net profit.
     
     Parameters:
-    profit_loss_data (List[Tuple[int, float]]): A list containing the day and net profit for that day.
+    days (array.array): The days, as returned by read_profit_loss.
+    net_profits (array.array): The net profit for each day, as returned by read_profit_loss.
 
     Returns:
-    List[Tuple[int, float]]: A list of tuples where each tuple contains the day and the difference in net profit from the previous day.
+    Tuple[array.array, array.array]: Two parallel arrays holding the days and the difference in net profit from the previous day.
     """
-    differences = []
-    
-    # Using a loop to iterate through the list of net profits to calculate the difference from the previous day.
-    for i in range(1, len(profit_loss_data)):
-        # Unpacking the current and previous day's profit for readability and ease of difference calculation.
-        current_day, current_profit = profit_loss_data[i]
-        _, previous_profit = profit_loss_data[i-1]
-        # Calculating the difference and appending it as a tuple to maintain a consistent data structure.
-        difference = current_profit - previous_profit
-        differences.append((current_day, difference))
-    
-    return differences
+    return daily_differences(days, net_profits)
 
-def find_extremes(differences):
+def find_extremes(days, differences):
     """
-    Finds the highest increase, highest decrease, or top 3 deficits in net profit.
+    Finds the highest increase, highest decrease, all deficits and top 3 deficits in net profit.
     
     Parameters:
-    differences (List[Tuple[int, float]]): A list containing the day and the difference in net profit.
+    days (array.array): The day for each entry in differences.
+    differences (array.array): The difference in net profit for each day.
 
     Returns:
-    Tuple[Tuple[int, float], Tuple[int, float], List[Tuple[int, float]]]: Contains the highest increase, highest decrease, and top 3 deficits in net profit.
+    Tuple[Tuple[int, float], Tuple[int, float], List[Tuple[int, float]], List[Tuple[int, float]]]: Contains the highest increase, highest decrease, all deficits and top 3 deficits in net profit.
     """
-    highest_increase = (0, 0)  # Initializing with a base value to be updated.
-    highest_decrease = (0, 0)  # Initializing with a base value to be updated.
-    deficits = []  # A list to track all deficits.
-
-    # Iterating through each day's difference to find significant changes.
-    for day, difference in differences:
-        # Updating the highest increase if the current difference is greater than the previously recorded one.
-        if difference > highest_increase[1]:
-            highest_increase = (day, difference)
-        # Updating the highest decrease if the current difference is lower than the previously recorded one.
-        elif difference < highest_decrease[1]:
-            highest_decrease = (day, difference)
-        # Tracking deficits (negative differences) for further analysis.
-        if difference < 0:
-            deficits.append((day, difference))
-
-    # Sorting the deficits list to prioritize days with the largest deficits.
-    # This utilizes a custom sorting function which is defined outside of the lambda scope for simplicity.
-    def sort_deficit(item):
-        return item[1]
-    deficits_sorted = sorted(deficits, key=sort_deficit)
-
-    # Selecting the top 3 deficits by slicing ensures we focus on the days with the most significant losses.
-    top_deficits = deficits_sorted[:3]
-
-    return highest_increase, highest_decrease, top_deficits
+    return daily_extremes(days, differences)
 
 # Example usage:
-# profit_loss_data = read_profit_loss('Profit_and_Loss.csv')
-# differences = compute_differences(profit_loss_data)
-# highest_increase, highest_decrease, top_deficits = find_extremes(differences)
+# days, net_profits = read_profit_loss('Profit_and_Loss.csv')
+# days, differences = compute_differences(days, net_profits)
+# highest_increase, highest_decrease, deficits, top_deficits = find_extremes(days, differences)
 